@@ -7,17 +7,116 @@
 
 """
 
-import datetime
+import inspect
+import logging
+import threading
+import time
+from collections import deque
 from copy import deepcopy
-from queue import Queue
 from .exception import InvalidMinInitCapacity, InvalidMaxCapacity, InvalidClass
 from .singleton_meta import SingletonMetaPoolRegistry
 
+log = logging.getLogger(__name__)
+
+
+def _wrap_legacy(func):
+    """Adapts old-style ``fn(resource, **stats)`` callables to the
+    ``fn(resource, stats)`` contract.
+
+    Detection runs once at pool creation, so new-style callables are
+    invoked directly and the hot path never rebuilds a kwargs dict.
+    """
+
+    try:
+        params = inspect.signature(func).parameters.values()
+    except (TypeError, ValueError):
+        return func
+
+    if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params):
+        def wrapper(resource, stats):
+            return func(resource, **stats)
+        return wrapper
+
+    return func
+
+
+_executor_cache = threading.local()
+
+
+class _FixedStack:
+    """Preallocated fixed-capacity stack with the small list API the pool uses.
+
+    For a bounded pool the capacity is known up front, so the slots are
+    allocated once and push/pop reduce to an index store and an index read -
+    no list growth or shrink on churn. Only used for thread_safe=False pools,
+    because the two-step push/pop is not atomic under the GIL the way a single
+    deque operation is.
+    """
+
+    __slots__ = ('_slots', '_top')
+
+    def __init__(self, capacity):
+        self._slots = [None] * capacity
+        self._top = 0
+
+    def append(self, item):
+        self._slots[self._top] = item
+        self._top += 1
+
+    def pop(self):
+        top = self._top - 1
+        if top < 0:
+            raise IndexError('pop from empty stack')
+        item = self._slots[top]
+        self._slots[top] = None
+        self._top = top
+        return item
+
+    def extend(self, items):
+        for item in items:
+            self.append(item)
+
+    def __len__(self):
+        return self._top
+
+
+class _Stats:
+    """Fixed-slot holder for per-resource usage stats.
+
+    A __slots__ object is a fraction of the size of the 4-key dict it
+    replaces and attribute access resolves to a fixed offset instead of a
+    string hash per lookup. ``keys``/``__getitem__`` keep dict-style access
+    (``stats['created_at']``, ``fn(resource, **stats)``) working for client
+    code.
+
+    ``created_at``/``last_used`` are ``time.monotonic()`` floats: one cheap
+    clock read per stamp and a single float compare per expiry check, instead
+    of datetime construction and field-wise datetime comparison.
+    """
+
+    __slots__ = ('count', 'new', 'created_at', 'last_used')
+
+    def __init__(self, count, new, created_at, last_used):
+        self.count = count
+        self.new = new
+        self.created_at = created_at
+        self.last_used = last_used
+
+    def keys(self):
+        return self.__slots__
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
 
 class ObjectPool(metaclass=SingletonMetaPoolRegistry):
     """
     This is singleton object pool class. It creates pool, checks expiry and validation of the resource.
 
+    Resources are handed out in LIFO (stack) order: the most recently released
+    resource is reused first, as it is the most likely to still be warm in CPU
+    caches or to hold live keep-alive state for connection-like resources.
+
     :param base_klass:  class for which pool will be created.
 
                         In the below example, Pool will be created for Browser class and used.
@@ -36,13 +135,18 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
                                 def do_work(self):
                                     return True
 
-                                def clean_up(self, **stats):
+                                def clean_up(self, stats):
                                     print("close connection object")
 
-                                def check_invalid(self, **stats):
+                                def check_invalid(self, stats):
                                     '''Returns True if resource is valid, otherwise False'''
                                     return False
 
+                        .. note::
+                            `clean_up` and `check_invalid` receive the resource stats as a single
+                            positional argument. The legacy ``fn(self, **stats)`` signature is still
+                            supported and detected once at pool creation.
+
     :param lazy: by default, resources are created when initiated.
                  lazy option will skip resource creation on init and will create
                  when the pool item is requested.
@@ -58,7 +162,7 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
                     and no resources are available for client, new resource will be created and provided to the
                     client. But this extra resource will not be queue, it will be cleaned up without performing
                     any validation.
-                -   pool is implemented using Queue. But maxsize is not provided to handle `max_capacity`.
+                -   pool is implemented using deque. But maxlen is not provided to handle `max_capacity`.
                     This is a implementation choice.
                 -   `As creation and cleaning up of additional resource performed when pool gets full,
                     This will slow down the program. This is a cue to check bottleneck on client processing.`
@@ -82,6 +186,14 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             database connection or closing browser are not performed, those process will run in the
             background and cause performance issue in the system.
 
+    :param thread_safe: pool storage is safe to share between threads by default.
+                        Pass thread_safe=False for pools that live on a single thread
+                        (per-worker or asyncio pools) to use a plain list as storage.
+
+        .. warning::
+            With **thread_safe=False**, sharing the pool between threads can corrupt
+            the pool storage. Use the default when in doubt.
+
     :param cloning: reserved resource will be created to create new resource, in case of resource expiration. Cloning is disabled by default. You can enable by passing cloning=True.
 
         .. note::
@@ -95,7 +207,7 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         ...     def do_work(self):
         ...         return "job done!"
         ...
-        ...     def clean_up(self, **stats):
+        ...     def clean_up(self, stats):
         ...         print("stats contains resource stats")
         >>> # default ConnectionPool options
         >>> connection_pool = ObjectPool(Browser, max_capacity=20, min_init=3, max_reusable=20,
@@ -104,7 +216,8 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
     """
 
     def __init__(self, klass, max_capacity=20, min_init=3, max_reusable=20,
-                 expires=600, lazy=False, pre_check=False, post_check=True, cloning=False):
+                 expires=600, lazy=False, pre_check=False, post_check=True,
+                 thread_safe=True, cloning=False):
         """
         Creates pool with given configuration
         """
@@ -117,18 +230,34 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         klass_check_invalid = getattr(klass, 'check_invalid', None)
         klass_cleanup = getattr(klass, 'clean_up', None)
 
-        self.__pool = Queue()
+        # deque append/pop are atomic under the GIL, so the default storage is
+        # safe to share between threads. Pools pinned to one thread skip that
+        # machinery: bounded ones get a preallocated fixed-capacity stack,
+        # unbounded ones a plain list.
+        if thread_safe:
+            self.__pool = deque()
+        elif max_capacity > 0:
+            self.__pool = _FixedStack(max(max_capacity, min_init))
+        else:
+            self.__pool = []
+        self.thread_safe = thread_safe
         self.__cloning = cloning
         self.klass = klass
         self.min_init = min_init
         self.max_capacity = max_capacity
         self.max_reusable_count = max_reusable
         self.expire_in_secs = expires
+        self._now = time.monotonic
         self.pre_check = pre_check
         self.post_check = post_check
 
-        self.__check_func = klass_check_invalid or None
-        self.__cleanup_func = klass_cleanup or None
+        self.__check_func = _wrap_legacy(klass_check_invalid) if klass_check_invalid else None
+        self.__cleanup_func = _wrap_legacy(klass_cleanup) if klass_cleanup else None
+
+        self._needs_internal_check = bool(self.max_reusable_count) or bool(self.expire_in_secs)
+
+        if self.__check_func is None and not self._needs_internal_check:
+            self.__check_and_get_resource = self.__update_and_get_resource
 
         if self.min_init <= 0 and not lazy:
             raise InvalidMinInitCapacity(self.pool_name)
@@ -137,25 +266,29 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             raise InvalidMaxCapacity(self.pool_name)
 
         if self.max_capacity == 0:
-            print(f'INFO:: {self.pool_name} Pool will have unlimited resources.')
+            log.info('%s Pool will have unlimited resources.', self.pool_name)
 
         if self.expire_in_secs == 0:
-            print(f'INFO:: {self.pool_name} Resources does not expire.')
+            log.info('%s Resources does not expire.', self.pool_name)
 
         if not klass_cleanup:
-            print(f'WARNING:: {self.pool_name} does not have cleanup method. '
-                  f'If destroy method is called, clean up such as closing connection '
-                  f'will not be performed. Thus will lead to system performance.')
+            log.warning('%s does not have cleanup method. '
+                        'If destroy method is called, clean up such as closing connection '
+                        'will not be performed. Thus will lead to system performance.',
+                        self.pool_name)
 
         if self.__cloning:
             self.__reserved_resource = self.klass()
+            self._new = self.__clone_reserved_resource
+        else:
+            self._new = self.klass
 
         if not lazy:
             self.__create_init_pool()
         else:
-            print(f'INFO:: {self.pool_name}: pool items will be created on request.')
+            log.info('%s: pool items will be created on request.', self.pool_name)
 
-        print(f'INFO:: {self.pool_name}: {self.get_pool_size()} pool items are created.')
+        log.info('%s: %s pool items are created.', self.pool_name, self.get_pool_size())
 
     def get(self):
         """
@@ -177,12 +310,37 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         """
         return self.__class__.Executor(self)
 
+    def get_fast(self):
+        """Same as :meth:`get` but reuses a per-thread cached Executor
+        instead of allocating one per call.
+
+        Under heavy use (`with pool.get() as ...` thousands of times per
+        second), per-call Executor allocation creates GC pressure; the cached
+        instance removes it entirely.
+
+        .. note::
+            The cache holds a single Executor per thread, so do not nest
+            `get_fast()` blocks on the same thread - use :meth:`get` for the
+            inner block instead.
+        """
+
+        try:
+            executor = _executor_cache.executor
+        except AttributeError:
+            executor = _executor_cache.executor = self.__class__.Executor(self)
+        executor._pool = self
+        return executor
+
     def get_pool_size(self):
         """
-        Returns the size of the pool (queue).
+        Returns the size of the pool.
+
+        Any operation on the pool results in different output time to time
+        as the resources are removed from the pool and added back.
 
-        Any operation on the queue results in different output time to time
-        as the resources are removed from queue and added back.
+        This is a lock-free snapshot: len() on the pool storage is a single
+        O(1) length read that is atomic under the GIL, so monitoring code can
+        poll it at any rate without disturbing the get/release path.
 
         >>> pool = ObjectPool(Connection, min_init=3)
         >>> print(pool.get_pool_size())
@@ -190,7 +348,7 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
 
         """
 
-        return self.__pool.qsize()
+        return len(self.__pool)
 
     @staticmethod
     def pool_exists(klass):
@@ -221,7 +379,7 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         ...     def do_work(self):
         ...         return "job done!"
         ...
-        ...     def clean_up(self, **resource_stats):
+        ...     def clean_up(self, resource_stats):
         ...         return "cleanup performed!"
         ...
         >>> pool = ObjectPool(Connection, min_init=1)
@@ -230,15 +388,52 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         """
 
         klass = self.klass
+        pool = self.__pool
         while True:
-            if self.get_pool_size() == 0:
+            try:
+                resource, stats = pool.pop()
+            except IndexError:
                 break
-            else:
-                resource, stats = self.__pool.get()
-                self.__resource_cleanup(resource, stats)
+            self.__resource_cleanup(resource, stats)
 
         SingletonMetaPoolRegistry.remove_registry(klass)
 
+    def reap(self):
+        """Sweeps the idle pool once and cleans up expired resources.
+
+        Expiry is normally detected lazily on get/release, so after a long
+        idle period a burst of requests pays one cleanup-and-rebuild per
+        request. Calling this periodically (e.g. from a timer or between
+        batches) prunes expired resources in a single pass instead, so the
+        burst starts from a clean pool.
+
+        Returns the number of resources reaped.
+
+        .. note::
+            The sweep temporarily holds surviving resources outside the pool,
+            so run it from the thread that owns the pool or while the pool is
+            quiet.
+        """
+
+        if not self._needs_internal_check:
+            return 0
+
+        pool = self.__pool
+        survivors = []
+        reaped = 0
+
+        while pool:
+            resource, stats = pool.pop()
+            if self._internal_invalid_check(stats):
+                self.__resource_cleanup(resource, stats)
+                reaped += 1
+            else:
+                survivors.append((resource, stats))
+
+        survivors.reverse()
+        pool.extend(survivors)
+        return reaped
+
     def is_pool_full(self):
         """Return True if the pool is full, False otherwise.
 
@@ -256,14 +451,19 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
         return self.max_capacity != 0 and pool_size >= self.max_capacity
 
     def _get_resource(self):
-        """Returns pool if the pool is not empty else creates and sends pool to the client."""
-        pool_size = self.get_pool_size()
+        """Returns pool if the pool is not empty else creates and sends pool to the client.
 
-        if pool_size == 0:
-            obj = self.__create_new_pool_resource()
+        The pop is attempted first and the empty pool handled via IndexError:
+        checking the size and then popping would be two separate operations,
+        and on a shared pool another thread can empty it in between.
+        """
+
+        try:
+            obj, obj_stats = self.__pool.pop()
+        except IndexError:
+            obj = self._new()
             obj_stats = self._get_default_stats()
         else:
-            obj, obj_stats = self.__pool.get()
             if self.pre_check:
                 obj, obj_stats = self.__check_and_get_resource(obj, obj_stats)
 
@@ -278,50 +478,30 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             if self.post_check:
                 resource, resource_stats = self.__check_and_get_resource(resource, resource_stats)
 
-            self.__pool.put((resource, resource_stats))
+            self.__pool.append((resource, resource_stats))
         else:
             self.__resource_cleanup(resource, resource_stats)
 
-    def _internal_invalid_check(self, **resource_stats):
-        """Returns True if max reusable count, expiration and custom validation are valid else False"""
-
-        created_at = resource_stats.get('created_at', None)
-        count = resource_stats.get('count', None)
+    def _internal_invalid_check(self, resource_stats):
+        """Returns True if max reusable count, expiration and custom validation are valid else False
 
-        expired_by_max_reuse = self._is_expired_by_max_reuse(count)
-        expired_by_time = self._is_expired_by_time(created_at)
+        This runs on every validated get/release, so the usage and expiry
+        policies are checked inline rather than through helper methods: the
+        comparisons are two or three bytecodes each, cheaper than the method
+        calls that would wrap them.
+        """
 
-        if expired_by_max_reuse:
-            print("resource expired by usage count.")
+        count = resource_stats.count
+        if self.max_reusable_count != 0 and count and self.max_reusable_count <= count:
+            log.debug('resource expired by usage count.')
             return True
 
-        if expired_by_time:
-            print("resource expired by usage time.")
+        if self.expire_in_secs != 0 and self._now() - resource_stats.created_at > self.expire_in_secs:
+            log.debug('resource expired by usage time.')
             return True
 
         return False
 
-    def _is_expired_by_max_reuse(self, count):
-        """Checks if resource expired by usage policy"""
-        expired_by_max_reuse = self.max_reusable_count != 0 and count and self.max_reusable_count <= count
-        return expired_by_max_reuse
-
-    def _is_expired_by_time(self, created_at):
-        """Checks if resource expired by expiry policy"""
-        expires_at = self._get_expiry_time(created_at)
-        expired_by_time = self.expire_in_secs != 0 and expires_at < datetime.datetime.now()
-        return expired_by_time
-
-    def _get_expiry_time(self, created_at):
-        """provides expiring time of resource based on **expire_in_secs**"""
-
-        if created_at:
-            expires_at = created_at + datetime.timedelta(seconds=self.expire_in_secs)
-        else:
-            expires_at = datetime.datetime.now()
-
-        return expires_at
-
     def _get_default_stats(self, new=True):
         """Returns resource stats.
 
@@ -330,36 +510,26 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             `new` param indicates that, resource is expired and recreated.
         """
 
-        resource_stats = {
-            'count': 0,
-            'new': new,
-            'created_at': datetime.datetime.now(),
-            'last_used': datetime.datetime.now()
-        }
-        return resource_stats
+        now = self._now()
+        return _Stats(0, new, now, now)
 
     def __create_init_pool(self):
         """
         create pool upto min to put into the queue.
         """
 
+        now = self._now()
         for i in range(self.min_init):
-            resource = self.__create_new_pool_resource()
-            resource_stats = self._get_default_stats()
-            self.__pool.put((resource, resource_stats))
+            self.__pool.append((self._new(), _Stats(0, True, now, now)))
 
-    def __create_new_pool_resource(self):
-        """Creates new resource and returns it to client
+    def __clone_reserved_resource(self):
+        """Creates new resource by cloning the reserved instance.
 
-            - Creates new resource by cloning the reserved instance if cloning=True
-            - Creates new resource instance if cloning=False
+        Bound to `_new` in __init__ when cloning=True; otherwise `_new` is the
+        resource class itself, so creation is a single call either way.
         """
 
-        if self.__cloning:
-            resource = deepcopy(self.__reserved_resource)
-        else:
-            resource = self.klass()
-        return resource
+        return deepcopy(self.__reserved_resource)
 
     def __check_and_get_resource(self, resource, resource_stats):
         """Updates stats and returns if the resource is valid else creates a new resource and returns.
@@ -369,47 +539,67 @@ class ObjectPool(metaclass=SingletonMetaPoolRegistry):
             -   new - is updated after the time time use or recreated.
         """
         resource_stats = self.__update_resource_stats(resource_stats)
-        invalid_resource = self.__check_func(resource, **resource_stats) if callable(self.__check_func) else False
-        invalid_resource_internal = self._internal_invalid_check(**resource_stats)
+        invalid_resource = self.__check_func(resource, resource_stats) if self.__check_func is not None else False
+        invalid_resource_internal = self._internal_invalid_check(resource_stats) if self._needs_internal_check else False
         if invalid_resource or invalid_resource_internal:
             resource, resource_stats = self.__cleanup_and_get_resource(resource, resource_stats)
 
         return resource, resource_stats
 
+    def __update_and_get_resource(self, resource, resource_stats):
+        """Fast path bound in place of `__check_and_get_resource` when the pool
+        has no custom check function, no expiry and no reuse limit: the resource
+        is always valid, so only the stats need updating."""
+
+        return resource, self.__update_resource_stats(resource_stats)
+
     def __cleanup_and_get_resource(self, resource, resource_stats):
-        """Cleans up expired resource and creates new resource and return"""
+        """Cleans up expired resource and creates new resource and return
+
+        The expired resource's _Stats slot is reset in place rather than
+        replaced, so the churn path allocates only the new resource itself.
+        """
 
         self.__resource_cleanup(resource, resource_stats)
-        resource = self.__create_new_pool_resource()
-        resource_stats = self._get_default_stats(new=False)
+        resource = self._new()
+        now = self._now()
+        resource_stats.count = 0
+        resource_stats.new = False
+        resource_stats.created_at = now
+        resource_stats.last_used = now
         return resource, resource_stats
 
     def __resource_cleanup(self, resource, resource_stats):
         """Calls cleanup function if that is provided while creating pool."""
 
-        if callable(self.__cleanup_func):
-            self.__cleanup_func(resource, **resource_stats)
+        if self.__cleanup_func is not None:
+            self.__cleanup_func(resource, resource_stats)
 
     def __update_resource_stats(self, resource_stats):
         """Updates the stats of the resource"""
 
-        resource_stats['count'] = resource_stats['count'] + 1
-        resource_stats['new'] = False
-        resource_stats['last_used'] = datetime.datetime.now()
+        resource_stats.count += 1
+        resource_stats.new = False
+        resource_stats.last_used = self._now()
         return resource_stats
 
     class Executor:
         """
         This is context manager for **ObjectPool**
+
+        `__slots__` keeps instances small and skips per-instance `__dict__`
+        creation, which matters when one Executor is allocated per `get()`.
         """
 
+        __slots__ = ('_pool', 'resource', 'resource_stats')
+
         def __init__(self, klass):
-            self.__pool = klass
+            self._pool = klass
             self.resource, self.resource_stats = None, None
 
         def __enter__(self):
-            self.resource, self.resource_stats = self.__pool._get_resource()
+            self.resource, self.resource_stats = self._pool._get_resource()
             return self.resource, self.resource_stats
 
         def __exit__(self, exc_type, exc_val, exc_tb):
-            self.__pool._queue_resource(self.resource, self.resource_stats)
+            self._pool._queue_resource(self.resource, self.resource_stats)
@@ -23,7 +23,7 @@ class SingletonMetaPoolRegistry(type):
         :return: None
         """
 
-        cls.__registry.pop(klass.__name__, None)
+        cls.__registry.pop(klass, None)
 
     @classmethod
     def registry_exists(cls, base_klass):
@@ -32,23 +32,40 @@ class SingletonMetaPoolRegistry(type):
 
         :param base_klass: class for which registry will be created
         :return: boolean
+
+        .. note::
+            The registry is keyed by class object, so this is a single
+            identity-hash dict probe. Memoizing it (e.g. functools.lru_cache)
+            would add a second cache probe plus invalidation bookkeeping for
+            no gain.
         """
 
-        is_registered = base_klass.__name__ in cls.__registry
-        return is_registered
+        return base_klass in cls.__registry
 
     def __call__(cls, base_klass, force=False, **params):
+        """
+        Returns the registered pool for the class, creating it when missing.
+
+        With force=True, an existing pool is recreated only when the given
+        config differs from the one it was created with; recreating an
+        identical pool would just tear down and rebuild the same resources.
+        The old pool is destroy()'d before recreation so its resources get
+        their clean up instead of leaking.
+        """
 
         registry_name = getattr(base_klass, '__name__', None)
 
         if not registry_name:
             raise InvalidClass(base_klass)
 
-        is_registered = cls.registry_exists(base_klass)
+        entry = cls.__registry.get(base_klass)
 
-        if is_registered:
-            return cls.__registry[registry_name]
+        if entry is not None:
+            klass, config = entry
+            if not force or config == params:
+                return klass
+            klass.destroy()
 
         klass = super().__call__(base_klass, **params)
-        cls.__registry[registry_name] = klass
+        cls.__registry[base_klass] = (klass, dict(params))
         return klass
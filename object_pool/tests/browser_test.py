@@ -28,12 +28,12 @@ class FirefoxBrowser:
         self.page_title = browser.title
         return self.page_title
 
-    def clean_up(self, **stats):
+    def clean_up(self, stats):
         """quits browser and sets None, when this method is called"""
         self.browser.quit()
         self.browser = None
 
-    def check_invalid(self, **stats):
+    def check_invalid(self, stats):
         """Returns invalid=True if the browser accessed google web page, otherwise False"""
         if self.page_title == 'Google':
             return True
@@ -10,10 +10,10 @@ class Browser:
     def do_work(self):
         return True
 
-    def clean_up(self, **stats):
+    def clean_up(self, stats):
         print("connection object is closed")
 
-    def check_invalid(self, **stats):
+    def check_invalid(self, stats):
         '''Returns True if resource is valid, otherwise False'''
         return False
 
@@ -84,6 +84,26 @@ class ObjectPoolBehaviourTest(unittest.TestCase):
 
         self.assertNotEqual(item1, item)
 
+    def test_reap_removes_expired_items(self):
+        """reap prunes expired resources in one sweep instead of lazily"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=10)
+
+        time.sleep(13)
+
+        reaped = self.pool.reap()
+
+        self.assertEqual(reaped, 2)
+        self.assertEqual(self.pool.get_pool_size(), 0)
+
+    def test_reap_keeps_valid_items(self):
+        """reap is a no-op on a pool whose resources are still valid"""
+        self.pool = ObjectPool(self.klass, min_init=2, expires=600)
+
+        reaped = self.pool.reap()
+
+        self.assertEqual(reaped, 0)
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
     def test_multiple_pool_invocation(self):
 
         self.pool = ObjectPool(self.klass, min_init=2)
@@ -118,6 +138,21 @@ class ObjectPoolBehaviourTest(unittest.TestCase):
 
         self.assertEqual(p3_size, 1)
 
+    def test_get_fast_reuses_executor(self):
+        """get_fast reuses the same thread-local executor across calls"""
+        self.pool = ObjectPool(self.klass, min_init=1)
+
+        executor = self.pool.get_fast()
+        with executor as (item, item_stats):
+            t = item.do_work()
+
+        executor1 = self.pool.get_fast()
+        with executor1 as (item1, item_stats1):
+            t1 = item1.do_work()
+
+        self.assertIs(executor, executor1)
+        self.assertEqual(item, item1)
+
     def test_pool_with_reusable(self):
         """pool size will grow up to max. This test case is a simulation of
         concurrent access and pool growth"""
@@ -32,6 +32,26 @@ class ObjectPoolCreationTest(unittest.TestCase):
         self.pool = ObjectPool(self.klass, min_init=2, cloning=False)
         self.assertEqual(self.pool.get_pool_size(), 2)
 
+    def test_with_thread_safe_false(self):
+        """single-threaded pool behaves the same with plain list storage"""
+        self.pool = ObjectPool(self.klass, min_init=2, thread_safe=False)
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertTrue(item.do_work())
+
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+    def test_with_thread_safe_false_unbounded(self):
+        """single-threaded unbounded pool falls back to plain list storage"""
+        self.pool = ObjectPool(self.klass, min_init=2, max_capacity=0, thread_safe=False)
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
+        with self.pool.get() as (item, item_stats):
+            self.assertTrue(item.do_work())
+
+        self.assertEqual(self.pool.get_pool_size(), 2)
+
     def test_with_min_zero(self):
         """min_init can not be 0 with lazy=False option else exception will be raised"""
         self.skip_teardown = True
@@ -53,6 +73,19 @@ class ObjectPoolCreationTest(unittest.TestCase):
         self.pool = ObjectPool(self.klass, min_init=3, max_capacity=0)
         self.assertEqual(self.pool.get_pool_size(), 3)
 
+    def test_force_with_same_config(self):
+        """force=True with identical config returns the existing pool"""
+        self.pool = ObjectPool(self.klass, min_init=2)
+        pool1 = ObjectPool(self.klass, force=True, min_init=2)
+        self.assertEqual(self.pool, pool1)
+
+    def test_force_with_new_config(self):
+        """force=True with different config destroys and recreates the pool"""
+        pool = ObjectPool(self.klass, min_init=2)
+        self.pool = ObjectPool(self.klass, force=True, min_init=3)
+        self.assertNotEqual(self.pool, pool)
+        self.assertEqual(self.pool.get_pool_size(), 3)
+
     def test_creation_same_pool(self):
         """pool size should be same as min_init right after creation"""
         self.pool = ObjectPool(self.klass)